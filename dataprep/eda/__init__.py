@@ -2,14 +2,13 @@
 dataprep.eda
 ============
 """
-import tempfile
-
-from bokeh.io import output_file, output_notebook
-from .distribution import compute, plot, render
-from .correlation import compute_correlation, plot_correlation, render_correlation
-from .missing import compute_missing, plot_missing, render_missing
-from .create_report import create_report
-from .utils import is_notebook
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# The dtypes are imported eagerly, so importing dataprep.eda still loads
+# numpy, pandas and dask.dataframe.
 from .dtypes import (
     DType,
     Categorical,
@@ -22,6 +21,13 @@ from .dtypes import (
     Text,
 )
 
+if TYPE_CHECKING:
+    # Let static checkers see the lazily loaded names and their signatures.
+    from .distribution import compute, plot, render
+    from .correlation import compute_correlation, plot_correlation, render_correlation
+    from .missing import compute_missing, plot_missing, render_missing
+    from .create_report import create_report
+
 __all__ = [
     "plot_correlation",
     "compute_correlation",
@@ -44,6 +50,69 @@ __all__ = [
     "create_report",
 ]
 
+# The plotting entry points pull in bokeh and the render modules, which are
+# slow to import. They are loaded on first attribute access instead.
+_LAZY_ATTRS: Dict[str, str] = {
+    "compute": ".distribution",
+    "plot": ".distribution",
+    "render": ".distribution",
+    "compute_correlation": ".correlation",
+    "plot_correlation": ".correlation",
+    "render_correlation": ".correlation",
+    "compute_missing": ".missing",
+    "plot_missing": ".missing",
+    "render_missing": ".missing",
+    "create_report": ".create_report",
+}
+
+
+def _setup_notebook() -> None:
+    """
+    Set up bokeh for inline output the first time a plotting module is loaded.
+    """
+    # pylint: disable=import-outside-toplevel
+    from bokeh.io import output_notebook
+    from .utils import is_notebook
+
+    if is_notebook():
+        output_notebook(hide_banner=True)
+
+
+class _LazyModule(ModuleType):
+    """
+    Module type of dataprep.eda that resolves the plotting entry points on demand.
+    """
+
+    _notebook_ready = False
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in _LAZY_ATTRS:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+
+        attr = getattr(import_module(_LAZY_ATTRS[name], self.__name__), name)
+
+        # Run after the plotting module (and container.py's own output_notebook
+        # call) is imported, so the package level setting is applied last.
+        if not _LazyModule._notebook_ready:
+            _setup_notebook()
+            _LazyModule._notebook_ready = True
+
+        self.__dict__[name] = attr
+        return attr
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing the create_report subpackage binds it on the parent package,
+        # which would shadow the create_report function of the same name.
+        if (
+            name in _LAZY_ATTRS
+            and isinstance(value, ModuleType)
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            return
+        super().__setattr__(name, value)
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(_LAZY_ATTRS))
+
 
-if is_notebook():
-    output_notebook(hide_banner=True)
+sys.modules[__name__].__class__ = _LazyModule
@@ -0,0 +1,70 @@
+"""
+    module for testing the lazy loading of dataprep.eda.
+"""
+import subprocess
+import sys
+from pathlib import Path
+from textwrap import dedent
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+def _run(code: str) -> None:
+    subprocess.run([sys.executable, "-c", dedent(code)], check=True, cwd=ROOT)
+
+
+def test_import_does_not_load_bokeh() -> None:
+    _run("import sys, dataprep.eda; assert 'bokeh' not in sys.modules")
+
+
+def test_create_report_not_shadowed_by_subpackage() -> None:
+    _run(
+        """
+        import types
+        import dataprep.eda.create_report
+        from dataprep import eda
+
+        assert not isinstance(eda.create_report, types.ModuleType)
+        assert callable(eda.create_report)
+        """
+    )
+
+
+def test_star_import_binds_all_names() -> None:
+    _run(
+        """
+        import types
+        import dataprep.eda
+        from dataprep.eda import *
+
+        for name in dataprep.eda.__all__:
+            assert name in globals(), name
+            assert not isinstance(globals()[name], types.ModuleType), name
+        """
+    )
+
+
+def test_first_access_sets_up_notebook() -> None:
+    _run(
+        """
+        import sys
+        from unittest import mock
+        import bokeh.io
+        import dataprep.eda.utils
+
+        calls = []
+
+        def output_notebook(*args, **kwargs):
+            calls.append((args, kwargs, "dataprep.eda.distribution" in sys.modules))
+
+        with mock.patch.object(dataprep.eda.utils, "is_notebook", lambda: True):
+            with mock.patch.object(bokeh.io, "output_notebook", output_notebook):
+                from dataprep.eda import plot
+                from dataprep.eda import plot_missing
+
+        ours = [call for call in calls if call[:2] == ((), {"hide_banner": True})]
+        assert len(ours) == 1, calls
+        # called after the plotting module is imported, so it is applied last
+        assert ours[0][2] and calls[-1] == ours[0], calls
+        """
+    )